@@ -1,8 +1,17 @@
-import click
-import elastica as ea
-import numpy as np
-import sopht.simulator as sps
-import sopht.utils as spu
+import os
+
+# pin OpenMP threads of the flow solver to cores, unless set by the user. The
+# OpenMP runtimes (libgomp bundled with pyfftw for the FFT based Poisson solve,
+# and the system one used by the pystencils kernels) read these only once when
+# loaded, so this needs to happen before sopht (and hence pyfftw) is imported.
+os.environ.setdefault("OMP_PROC_BIND", "close")
+os.environ.setdefault("OMP_PLACES", "cores")
+
+import click  # noqa: E402
+import elastica as ea  # noqa: E402
+import numpy as np  # noqa: E402
+import sopht.simulator as sps  # noqa: E402
+import sopht.utils as spu  # noqa: E402
 
 
 def flow_past_sphere_case(
@@ -14,9 +23,12 @@ def flow_past_sphere_case(
     num_threads: int = 4,
     precision: str = "single",
     save_flow_data: bool = False,
+    verbose_diag: bool = False,
 ) -> None:
     """
     This example considers the case of flow past a sphere in 3D.
+    Diagnostics which need a full sweep over the flow fields are only
+    computed if verbose_diag is True.
     """
     grid_dim = 3
     grid_size_z, grid_size_y, grid_size_x = grid_size
@@ -46,7 +58,9 @@ def flow_past_sphere_case(
     drag_force_scale = 0.5 * rho_f * far_field_velocity**2 * sphere_projected_area
 
     # Initialize velocity = c in X direction
-    velocity_free_stream = np.array([far_field_velocity, 0.0, 0.0])
+    velocity_free_stream: np.ndarray = np.array(
+        [far_field_velocity, 0.0, 0.0], dtype=real_t
+    )
 
     # Initialize fixed sphere (elastica rigid body)
     x_cm = 0.25 * flow_sim.x_range
@@ -85,6 +99,11 @@ def flow_past_sphere_case(
                 "vorticity": flow_sim.vorticity_field,
                 "velocity": flow_sim.velocity_field,
             },
+            # write fields in compressed tiles (spanning the contiguous x axis), to
+            # cut down on disk bandwidth; gzip is used since Paraview can't read lzf
+            chunks=(max(1, grid_size_z // 8), max(1, grid_size_y // 8), grid_size_x),
+            compression="gzip",
+            compression_opts=1,
         )
         # Initialize sphere IO
         sphere_io = spu.IO(dim=grid_dim, real_dtype=real_t)
@@ -100,11 +119,12 @@ def flow_past_sphere_case(
     t_end = t_end_hat * timescale  # dimensional end time
     foto_timer = 0.0
     foto_timer_limit = timescale
+    mid_y_idx = grid_size_y // 2
     # Find the sphere center on euler grid
     # First find the euler grid centers in z direction
     euler_grid_center_in_z_dir = 0.5 * (
-        flow_sim.position_field[z_axis_idx, 1:, grid_size_y // 2, 0]
-        + flow_sim.position_field[z_axis_idx, :-1, grid_size_y // 2, 0]
+        flow_sim.position_field[z_axis_idx, 1:, mid_y_idx, 0]
+        + flow_sim.position_field[z_axis_idx, :-1, mid_y_idx, 0]
     )
     # Find the sphere center in z direction
     lag_grid_center_in_z_dir = np.mean(
@@ -114,115 +134,154 @@ def flow_past_sphere_case(
     sphere_center_on_euler_grid_idx = int(
         np.argmin(np.abs(euler_grid_center_in_z_dir - lag_grid_center_in_z_dir))
     )
-    time = []
-    drag_coeffs = []
-    flow_vel_along_sphere_center = []
+    # x component of the Lagrangian grid forcing, updated in place every step
+    sphere_lag_grid_x_forcing = sphere_flow_interactor.lag_grid_forcing_field[
+        x_axis_idx
+    ]
+    # views of the flow fields used for post-processing, these are loop invariant
+    velocity_x_field = flow_sim.velocity_field[x_axis_idx]
+    # velocity near the XZ mid-plane, 2 grid points in y
+    mid_y_velocity_x_slab = velocity_x_field[:, mid_y_idx - 1 : mid_y_idx + 1, :]
+    # velocity along the center line of the sphere, 2 grid points in z and y
+    center_line_velocity_x_slab = mid_y_velocity_x_slab[
+        sphere_center_on_euler_grid_idx : sphere_center_on_euler_grid_idx + 2
+    ]
+    x_grid_xz_plane = flow_sim.position_field[x_axis_idx, :, mid_y_idx, :]
+    z_grid_xz_plane = flow_sim.position_field[z_axis_idx, :, mid_y_idx, :]
+    # samples are taken at t = 0 and then after every foto_timer_limit, which
+    # bounds the number of samples (+1 for round off in the timers)
+    max_num_samples = int(np.ceil(t_end / foto_timer_limit)) + 1
+    num_samples = 0
+    time: np.ndarray = np.zeros(max_num_samples)
+    drag_coeffs: np.ndarray = np.zeros(max_num_samples, dtype=real_t)
+    flow_vel_along_sphere_center: np.ndarray = np.zeros(
+        (max_num_samples, grid_size_x), dtype=real_t
+    )
 
     # create fig for plotting flow fields
     fig, ax = spu.create_figure_and_axes()
+    lab_cmap = spu.get_lab_cmap()
+    # buffer for the y-averaged x velocity plotted on the XZ plane
+    plot_velocity_x: np.ndarray = np.zeros((grid_size_z, grid_size_x), dtype=real_t)
+    # the flow image, its colorbar and the (fixed) sphere forcing points are drawn
+    # once, after which only the image data is updated for every snapshot
+    half_dx = 0.5 * flow_sim.dx
+    velocity_x_image = ax.imshow(
+        plot_velocity_x,
+        origin="lower",
+        extent=(
+            x_grid_xz_plane.min() - half_dx,
+            x_grid_xz_plane.max() + half_dx,
+            z_grid_xz_plane.min() - half_dx,
+            z_grid_xz_plane.max() + half_dx,
+        ),
+        interpolation="bilinear",
+        cmap=lab_cmap,
+    )
+    # grid lines are otherwise drawn over the image
+    ax.grid(False)
+    fig.colorbar(mappable=velocity_x_image, ax=ax)
+    ax.scatter(
+        sphere_flow_interactor.forcing_grid.position_field[x_axis_idx],
+        sphere_flow_interactor.forcing_grid.position_field[z_axis_idx],
+        s=5,
+        color="k",
+    )
+
+    # drag is written out row by row (line buffered), as it is computed, so that
+    # partial results are on disk if a long run is interrupted
+    with open("drag_vs_time.csv", "w", buffering=1) as drag_csv_file:
+        drag_csv_file.write("# time, drag_coeff\n")
 
-    # iterate
-    while flow_sim.time < t_end:
-        # Save data
-        if foto_timer > foto_timer_limit or foto_timer == 0:
-            foto_timer = 0.0
-            # calculate drag
-            drag_force = np.fabs(
-                np.sum(sphere_flow_interactor.lag_grid_forcing_field[x_axis_idx, ...])
-            )
-            drag_coeff = drag_force / drag_force_scale
-            time.append(flow_sim.time)
-            drag_coeffs.append(drag_coeff)
-            flow_vel_along_sphere_center.append(
+        # iterate
+        while flow_sim.time < t_end:
+            # Save data
+            if foto_timer > foto_timer_limit or foto_timer == 0:
+                foto_timer = 0.0
+                # calculate drag
+                drag_force = np.fabs(sphere_lag_grid_x_forcing.sum())
+                drag_coeff = drag_force / drag_force_scale
+                time[num_samples] = flow_sim.time
+                drag_coeffs[num_samples] = drag_coeff
+                drag_csv_file.write(f"{flow_sim.time:.18e},{drag_coeff:.18e}\n")
                 np.mean(
                     np.mean(
-                        flow_sim.velocity_field[
-                            x_axis_idx,
-                            sphere_center_on_euler_grid_idx : sphere_center_on_euler_grid_idx
-                            + 2,
-                            grid_size_y // 2 - 1 : grid_size_y // 2 + 1,
-                            :,
-                        ],
+                        center_line_velocity_x_slab,
                         axis=1,  # Average velocities in y
                     ),
                     axis=0,  # Average velocities in z
+                    out=flow_vel_along_sphere_center[num_samples],
                 )
-            )
-            if save_flow_data:
-                io.save(
-                    h5_file_name="sopht_"
-                    + str("%0.4d" % (flow_sim.time * 100))
-                    + ".h5",
-                    time=flow_sim.time,
+                num_samples += 1
+                if save_flow_data:
+                    io.save(
+                        h5_file_name="sopht_"
+                        + str("%0.4d" % (flow_sim.time * 100))
+                        + ".h5",
+                        time=flow_sim.time,
+                    )
+                    sphere_io.save(
+                        h5_file_name="sphere_"
+                        + str("%0.4d" % (flow_sim.time * 100))
+                        + ".h5",
+                        time=flow_sim.time,
+                    )
+                ax.set_title(f"Velocity X comp, time: {flow_sim.time / timescale:.2f}")
+                # average of the 2 y planes, done inplace in the buffer
+                np.add(
+                    mid_y_velocity_x_slab[:, 0],
+                    mid_y_velocity_x_slab[:, 1],
+                    out=plot_velocity_x,
                 )
-                sphere_io.save(
-                    h5_file_name="sphere_"
-                    + str("%0.4d" % (flow_sim.time * 100))
-                    + ".h5",
-                    time=flow_sim.time,
+                plot_velocity_x *= 0.5
+                velocity_x_image.set_data(plot_velocity_x)
+                # rescale colors to the current data range, this updates the colorbar
+                velocity_x_image.autoscale()
+                fig.savefig(
+                    "snap_" + str("%0.4d" % (flow_sim.time * 100)) + ".png",
+                    bbox_inches="tight",
+                    pad_inches=0,
                 )
-            ax.set_title(f"Velocity X comp, time: {flow_sim.time / timescale:.2f}")
-            contourf_obj = ax.contourf(
-                flow_sim.position_field[x_axis_idx, :, grid_size_y // 2, :],
-                flow_sim.position_field[z_axis_idx, :, grid_size_y // 2, :],
-                np.mean(
-                    flow_sim.velocity_field[
-                        x_axis_idx, :, grid_size_y // 2 - 1 : grid_size_y // 2 + 1, :
-                    ],
-                    axis=1,
-                ),
-                levels=50,
-                extend="both",
-                cmap=spu.get_lab_cmap(),
-            )
-            cbar = fig.colorbar(mappable=contourf_obj, ax=ax)
-            ax.scatter(
-                sphere_flow_interactor.forcing_grid.position_field[x_axis_idx],
-                sphere_flow_interactor.forcing_grid.position_field[z_axis_idx],
-                s=5,
-                color="k",
-            )
-            spu.save_and_clear_fig(
-                fig,
-                ax,
-                cbar,
-                file_name="snap_" + str("%0.4d" % (flow_sim.time * 100)) + ".png",
-            )
-            print(
-                f"time: {flow_sim.time:.2f} ({(flow_sim.time/t_end*100):2.1f}%), "
-                f"max_vort: {np.amax(flow_sim.vorticity_field):.4f}, "
-                f"drag coeff: {drag_coeff:.4f}, "
-                f"vort divg. L2 norm: {flow_sim.get_vorticity_divergence_l2_norm():.4f} "
-                "grid deviation L2 error: "
-                f"{sphere_flow_interactor.get_grid_deviation_error_l2_norm():.6f}"
-            )
+                diagnostics = (
+                    f"time: {flow_sim.time:.2f} ({(flow_sim.time/t_end*100):2.1f}%), "
+                    f"drag coeff: {drag_coeff:.4f}, "
+                    "grid deviation L2 error: "
+                    f"{sphere_flow_interactor.get_grid_deviation_error_l2_norm():.6f}"
+                )
+                # diagnostics needing full sweeps over the flow fields
+                if verbose_diag:
+                    max_vort = np.amax(flow_sim.vorticity_field)
+                    vort_divg_l2_norm = flow_sim.get_vorticity_divergence_l2_norm()
+                    diagnostics += (
+                        f", max_vort: {max_vort:.4f}, "
+                        f"vort divg. L2 norm: {vort_divg_l2_norm:.4f}"
+                    )
+                print(diagnostics)
 
-        dt = flow_sim.compute_stable_timestep(dt_prefac=0.5)
+            dt = flow_sim.compute_stable_timestep(dt_prefac=0.5)
 
-        # compute flow forcing and timestep forcing
-        sphere_flow_interactor.time_step(dt=dt)
-        sphere_flow_interactor()
+            # compute flow forcing and timestep forcing
+            # these steps are strictly sequential, and hence not run concurrently:
+            # grid deviation update needs dt (from the latest flow velocity), forcing
+            # needs the updated grid deviation, and the flow step needs the forcing
+            sphere_flow_interactor.time_step(dt=dt)
+            sphere_flow_interactor()
 
-        flow_sim.time_step(dt=dt, free_stream_velocity=velocity_free_stream)
+            flow_sim.time_step(dt=dt, free_stream_velocity=velocity_free_stream)
 
-        # update timers
-        foto_timer += dt
+            # update timers
+            foto_timer += dt
 
     fig, ax = spu.create_figure_and_axes(fig_aspect_ratio="default")
-    ax.plot(np.array(time), np.array(drag_coeffs), label="numerical")
+    ax.plot(time[:num_samples], drag_coeffs[:num_samples], label="numerical")
     ax.set_xlabel("Time")
     ax.set_ylabel("Drag coefficient")
     fig.savefig("drag_coeff_vs_time.png")
-    np.savetxt(
-        "drag_vs_time.csv",
-        np.c_[np.array(time), np.array(drag_coeffs)],
-        delimiter=",",
-        header="time, drag_coeff",
-    )
-
     np.savetxt(
         "x_vel_along_center_line_vs_time.csv",
-        np.c_[np.array(time), np.array(flow_vel_along_sphere_center)],
+        np.column_stack(
+            (time[:num_samples], flow_vel_along_sphere_center[:num_samples])
+        ),
         delimiter=",",
         header="time, flow_vel_along_sphere_center",
     )
@@ -242,8 +301,13 @@ if __name__ == "__main__":
     @click.option("--num_threads", default=4, help="Number of threads for parallelism.")
     @click.option("--nx", default=128, help="Number of grid points in x direction.")
     @click.option("--reynolds", default=100.0, help="Reynolds number of flow.")
+    @click.option(
+        "--verbose_diag",
+        is_flag=True,
+        help="Print diagnostics which need full sweeps over the flow fields.",
+    )
     def simulate_parallelised_flow_past_sphere(
-        num_threads: int, nx: int, reynolds: float
+        num_threads: int, nx: int, reynolds: float, verbose_diag: bool
     ) -> None:
         ny = nx // 2
         nz = nx // 2
@@ -258,6 +322,7 @@ if __name__ == "__main__":
             num_threads=num_threads,
             reynolds=reynolds,
             save_flow_data=False,
+            verbose_diag=verbose_diag,
         )
 
     simulate_parallelised_flow_past_sphere()
@@ -29,11 +29,13 @@ class CosseratRodFlowInteraction(ImmersedBodyFlowInteraction):
         **forcing_grid_kwargs,
     ) -> None:
         """Class initialiser."""
-        body_flow_forces = np.zeros(
-            (3, cosserat_rod.n_elems + 1),
+        # in flow precision, to avoid casts when transferring forcing from the
+        # Lagrangian grid (which is in flow precision)
+        body_flow_forces: np.ndarray = np.zeros(
+            (3, cosserat_rod.n_elems + 1), dtype=real_t
         )
-        body_flow_torques = np.zeros(
-            (3, cosserat_rod.n_elems),
+        body_flow_torques: np.ndarray = np.zeros(
+            (3, cosserat_rod.n_elems), dtype=real_t
         )
         forcing_grid_kwargs["cosserat_rod"] = cosserat_rod
 
@@ -3,6 +3,7 @@ from elastica.interaction import node_to_element_velocity, elements_to_nodes_inp
 import elastica as ea
 import numpy as np
 from sopht.simulator.immersed_body import ImmersedBodyForcingGrid
+import sopht.utils as spu
 
 
 class CosseratRodNodalForcingGrid(ImmersedBodyForcingGrid):
@@ -90,10 +91,9 @@ class CosseratRodElementCentricForcingGrid(ImmersedBodyForcingGrid):
 
     def compute_lag_grid_position_field(self) -> None:
         """Computes location of forcing grid for the Cosserat rod"""
-        self.position_field[...] = (
-            self.cosserat_rod.position_collection[: self.grid_dim, 1:]
-            + self.cosserat_rod.position_collection[: self.grid_dim, :-1]
-        ) / 2.0
+        spu.compute_rod_element_position(
+            self.position_field, self.cosserat_rod.position_collection
+        )
 
     def compute_lag_grid_velocity_field(self) -> None:
         """Computes velocity of forcing grid points for the Cosserat rod"""
@@ -150,6 +150,7 @@ class CosseratRodEdgeForcingGrid(ImmersedBodyForcingGrid):
         )
 
         self.moment_arm = np.zeros((3, cosserat_rod.n_elems))
+        self.rod_element_position = np.zeros((3, cosserat_rod.n_elems))
 
         self.start_idx_elems = 0
         self.end_idx_elems = self.start_idx_elems + cosserat_rod.n_elems
@@ -172,14 +173,13 @@ class CosseratRodEdgeForcingGrid(ImmersedBodyForcingGrid):
     def compute_lag_grid_position_field(self) -> None:
         """Computes location of forcing grid for the Cosserat rod"""
 
-        rod_element_position = 0.5 * (
-            self.cosserat_rod.position_collection[..., 1:]
-            + self.cosserat_rod.position_collection[..., :-1]
+        spu.compute_rod_element_position(
+            self.rod_element_position, self.cosserat_rod.position_collection
         )
 
         self.position_field[
             :, self.start_idx_elems : self.end_idx_elems
-        ] = rod_element_position[: self.grid_dim]
+        ] = self.rod_element_position[: self.grid_dim]
 
         # Rod normal is used to compute the edge points. Rod normal is not necessarily be same as the d1.
         # Here we also assume rod will always be in XY plane.
@@ -191,13 +191,13 @@ class CosseratRodEdgeForcingGrid(ImmersedBodyForcingGrid):
         # x_elem + rd1
         self.position_field[
             :, self.start_idx_left_edge_nodes : self.end_idx_left_edge_nodes
-        ] = (rod_element_position + self.moment_arm)[: self.grid_dim]
+        ] = (self.rod_element_position + self.moment_arm)[: self.grid_dim]
 
         # x_elem - rd1
         # self.moment_arm_edge_right[:] = -self.moment_arm_edge_left
         self.position_field[
             :, self.start_idx_right_edge_nodes : self.end_idx_right_edge_nodes
-        ] = (rod_element_position - self.moment_arm)[: self.grid_dim]
+        ] = (self.rod_element_position - self.moment_arm)[: self.grid_dim]
 
     def compute_lag_grid_velocity_field(self) -> None:
         """Computes velocity of forcing grid points for the Cosserat rod"""
@@ -406,9 +406,8 @@ class CosseratRodSurfaceForcingGrid(ImmersedBodyForcingGrid):
     def compute_lag_grid_position_field(self) -> None:
         """Computes location of forcing grid for the Cosserat rod"""
 
-        self.rod_element_position[...] = 0.5 * (
-            self.cosserat_rod.position_collection[..., 1:]
-            + self.cosserat_rod.position_collection[..., :-1]
+        spu.compute_rod_element_position(
+            self.rod_element_position, self.cosserat_rod.position_collection
         )
 
         # Cache rod director collection transpose since it will be used to compute velocity field.
@@ -2,6 +2,7 @@ from .lab_cmap import get_lab_cmap
 from .plot_field import create_figure_and_axes, save_and_clear_fig
 from .post_process import make_video_from_image_series, make_dir_and_transfer_h5_data
 from .field import VectorField
+from .rod_element_position import compute_rod_element_position
 from .io import IO, CosseratRodIO, EulerianFieldIO
 from .rod_viz import plot_video_of_rod_surface
 from .precision import get_real_t, get_test_tol
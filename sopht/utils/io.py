@@ -56,6 +56,9 @@ class IO:
         origin: np.ndarray,
         dx: np.ndarray,
         grid_size: np.ndarray,
+        chunks: tuple[int, ...] | None = None,
+        compression: str | None = None,
+        compression_opts: int | None = None,
     ) -> None:
         """
         Define the Eulerian grid mesh.
@@ -71,6 +74,16 @@ class IO:
         grid_size: numpy.ndarray
             1D (dim,) array containing data with 'float' type.
             Array containing grid_size in each dimension following z-y-x ordering.
+        chunks: tuple
+            Optional (dim,) tuple of HDF5 chunk (tile) shape for the Eulerian
+            fields following z-y-x ordering. Fields are stored contiguously if None.
+        compression: str
+            Optional HDF5 compression filter for the Eulerian fields, for e.g.
+            'gzip'. Needs chunked storage, which h5py sets up automatically if
+            chunks are not given. Note that 'lzf' is only available in h5py,
+            and files written with it can not be read in Paraview.
+        compression_opts: int
+            Optional compression setting for the filter, for e.g. gzip level.
         """
         assert isinstance(origin, np.ndarray)
         assert isinstance(dx, np.ndarray)
@@ -78,6 +91,10 @@ class IO:
         self.eulerian_origin = origin
         self.eulerian_dx = dx
         self.eulerian_grid_size = grid_size  # z,y,x
+        # leading 1 to account for the additional dimension added during save
+        self.eulerian_chunks = None if chunks is None else (1, *chunks)
+        self.eulerian_compression = compression
+        self.eulerian_compression_opts = compression_opts
         self.eulerian_grid_defined = True
 
     def add_as_eulerian_fields_for_io(self, **fields_for_io) -> None:
@@ -236,6 +253,9 @@ class IO:
                         eulerian_scalar_grp.create_dataset(
                             field_name,
                             data=field.reshape(1, *self.eulerian_grid_size),
+                            chunks=self.eulerian_chunks,
+                            compression=self.eulerian_compression,
+                            compression_opts=self.eulerian_compression_opts,
                         )
                     elif field_type == "Vector":
                         # Decompose vector fields into individual component as scalar fields
@@ -245,6 +265,9 @@ class IO:
                                 data=field[idx_dim, ...].reshape(
                                     1, *self.eulerian_grid_size
                                 ),
+                                chunks=self.eulerian_chunks,
+                                compression=self.eulerian_compression,
+                                compression_opts=self.eulerian_compression_opts,
                             )
                     else:
                         raise ValueError(
@@ -644,9 +667,8 @@ class CosseratRodIO(IO):
         self._save(h5_file_name=h5_file_name, time=time)
 
     def _update_rod_element_position(self) -> None:
-        self.rod_element_position[...] = 0.5 * (
-            self.cosserat_rod.position_collection[: self.dim, 1:]
-            + self.cosserat_rod.position_collection[: self.dim, :-1]
+        spu.compute_rod_element_position(
+            self.rod_element_position, self.cosserat_rod.position_collection
         )
 
 
@@ -656,13 +678,21 @@ class EulerianFieldIO(IO):
     """
 
     def __init__(
-        self, position_field: np.ndarray, eulerian_fields_dict: dict[str, np.ndarray]
+        self,
+        position_field: np.ndarray,
+        eulerian_fields_dict: dict[str, np.ndarray],
+        chunks: tuple[int, ...] | None = None,
+        compression: str | None = None,
+        compression_opts: int | None = None,
     ) -> None:
         """Class initializer
 
         :param position_field: Array with position coordinates, of shape (grid_dim, grid_size)
         :param eulerian_fields_dict: Dictionary with keys as names of Eulerian fields
         to be saved, with corresponding values representing the field array names
+        :param chunks: Optional HDF5 chunk shape of the fields (same ordering as grid_size)
+        :param compression: Optional HDF5 compression filter of the fields
+        :param compression_opts: Optional setting for the compression filter
 
         """
         grid_dim = position_field.shape[0]
@@ -695,5 +725,12 @@ class EulerianFieldIO(IO):
         dx = x_grid_flattened_field[1] - x_grid_flattened_field[0]
         io_dx = dx * np.ones(grid_dim)
         io_grid_size = np.array(grid_size)
-        self.define_eulerian_grid(origin=io_origin, dx=io_dx, grid_size=io_grid_size)
+        self.define_eulerian_grid(
+            origin=io_origin,
+            dx=io_dx,
+            grid_size=io_grid_size,
+            chunks=chunks,
+            compression=compression,
+            compression_opts=compression_opts,
+        )
         self.add_as_eulerian_fields_for_io(**eulerian_fields_dict)
@@ -1,20 +1,61 @@
 def make_video_from_image_series(
     video_name: str, image_series_name: str, frame_rate: int
 ) -> None:
-    """Makes a video using ffmpeg from series of images"""
-    import os
+    """Makes a video using ffmpeg from series of images
+
+    If ffmpeg is not available or fails, a warning is logged and the image
+    series is kept, so that the video can be made later on.
+    """
+    import logging
+    import pathlib
+    import shutil
+    import subprocess
 
+    log = logging.getLogger()
+    if shutil.which("ffmpeg") is None:
+        log.warning(
+            f"ffmpeg not found, skipping video {video_name}.mp4; "
+            f"keeping the {image_series_name}*.png image series."
+        )
+        return
     # remove previous video
-    os.system(f"rm -f {video_name}.mp4")
-    # ffmpeg magic!
-    os.system(
-        f"ffmpeg -r {frame_rate} -s 3840x2160 -f image2 -pattern_type glob "
-        f"-i '{image_series_name}*.png' "
-        "-vcodec libx264 -crf 15 -pix_fmt yuv420p -vf "
-        f"'crop=trunc(iw/2)*2:trunc(ih/2)*2' {video_name}.mp4"
-    )
+    pathlib.Path(f"{video_name}.mp4").unlink(missing_ok=True)
+    # ffmpeg magic! (ffmpeg expands the glob pattern itself)
+    try:
+        subprocess.run(
+            [
+                "ffmpeg",
+                "-r",
+                f"{frame_rate}",
+                "-s",
+                "3840x2160",
+                "-f",
+                "image2",
+                "-pattern_type",
+                "glob",
+                "-i",
+                f"{image_series_name}*.png",
+                "-vcodec",
+                "libx264",
+                "-crf",
+                "15",
+                "-pix_fmt",
+                "yuv420p",
+                "-vf",
+                "crop=trunc(iw/2)*2:trunc(ih/2)*2",
+                f"{video_name}.mp4",
+            ],
+            check=True,
+        )
+    except subprocess.CalledProcessError as error:
+        log.warning(
+            f"ffmpeg failed (exit code {error.returncode}) to make video "
+            f"{video_name}.mp4; keeping the {image_series_name}*.png image series."
+        )
+        return
     # remove image series
-    os.system(f"rm -f {image_series_name}*.png")
+    for image_path in pathlib.Path(".").glob(f"{image_series_name}*.png"):
+        image_path.unlink()
 
 
 def make_dir_and_transfer_h5_data(dir_name: str, clean_dir: bool = True) -> None:
@@ -0,0 +1,27 @@
+"""Cosserat rod element position kernel."""
+from numba import njit
+
+
+# signature is pinned since pyelastica rods are always in double precision, so
+# the kernel is compiled once (eagerly), and any array layout is accepted
+@njit("void(float64[:, :], float64[:, :])", cache=True, fastmath=True)
+def compute_rod_element_position(rod_element_position, rod_position_collection):
+    """Compute element center positions from the rod nodal positions.
+
+    Fused loop version of 0.5 * (x[..., 1:] + x[..., :-1]), which avoids the
+    temporary arrays of the numpy expression. Only the leading
+    rod_element_position.shape[0] coordinates are computed, so that the
+    kernel can write directly into 2D forcing grids.
+
+    The rod position collection can be a view into the pyelastica block
+    memory, and hence need not be C contiguous as a whole; its rows (along the
+    nodes) are always unit stride though, so the loop over nodes is kept
+    innermost for vectorised loads.
+
+    """
+    n_elems = rod_element_position.shape[1]
+    for d in range(rod_element_position.shape[0]):
+        for i in range(n_elems):
+            rod_element_position[d, i] = 0.5 * (
+                rod_position_collection[d, i + 1] + rod_position_collection[d, i]
+            )
@@ -7,20 +7,22 @@ from tests.test_simulator.test_immersed_body.cosserat_rod.test_cosserat_rod_forc
 )
 
 
+@pytest.mark.parametrize("precision", ["single", "double"])
 @pytest.mark.parametrize("n_elems", [8, 16])
-def test_cosserat_rod_flow_interaction(n_elems):
+def test_cosserat_rod_flow_interaction(n_elems, precision):
     cosserat_rod = mock_straight_rod(n_elems)
     grid_size = (16, 16)
     forcing_grid_cls = sps.CosseratRodElementCentricForcingGrid
+    real_t = get_real_t(precision)
     rod_flow_interactor = sps.CosseratRodFlowInteraction(
         cosserat_rod=cosserat_rod,
-        eul_grid_forcing_field=np.zeros(grid_size),
-        eul_grid_velocity_field=np.zeros(grid_size),
+        eul_grid_forcing_field=np.zeros(grid_size, dtype=real_t),
+        eul_grid_velocity_field=np.zeros(grid_size, dtype=real_t),
         virtual_boundary_stiffness_coeff=1.0,
         virtual_boundary_damping_coeff=1.0,
         dx=1.0,
         grid_dim=2,
-        real_t=get_real_t(),
+        real_t=real_t,
         forcing_grid_cls=forcing_grid_cls,
     )
     rod_dim = 3
@@ -31,4 +33,6 @@ def test_cosserat_rod_flow_interaction(n_elems):
     np.testing.assert_allclose(
         rod_flow_interactor.body_flow_torques, np.zeros((rod_dim, cosserat_rod.n_elems))
     )
+    assert rod_flow_interactor.body_flow_forces.dtype == real_t
+    assert rod_flow_interactor.body_flow_torques.dtype == real_t
     assert isinstance(rod_flow_interactor.forcing_grid, forcing_grid_cls)
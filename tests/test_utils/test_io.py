@@ -1,6 +1,7 @@
 import pytest
 import sopht.utils as spu
 import elastica as ea
+import h5py
 import numpy as np
 import os
 
@@ -444,7 +445,12 @@ def test_cosserat_rod_io(dim, precision):
 @pytest.mark.parametrize("precision", ["single", "double"])
 @pytest.mark.parametrize("grid_dim", [2, 3])
 @pytest.mark.parametrize("grid_size_x", [8, 16])
-def test_eulerian_field_io(grid_dim, precision, grid_size_x):
+@pytest.mark.parametrize(
+    "compression, compression_opts", [(None, None), ("gzip", None), ("gzip", 1)]
+)
+def test_eulerian_field_io(
+    grid_dim, precision, grid_size_x, compression, compression_opts
+):
     real_t = spu.get_real_t(precision)
     grid_size = (grid_size_x,) * grid_dim
     scalar_field = np.random.rand(*grid_size).astype(real_t)
@@ -460,12 +466,28 @@ def test_eulerian_field_io(grid_dim, precision, grid_size_x):
     h5_file_name = "eulerian_field.h5"
     time = 2.0
     eulerian_field_dict = {"scalar_field": scalar_field, "vector_field": vector_field}
+    chunks = None if compression is None else (grid_size_x // 2,) * grid_dim
     test_io = spu.EulerianFieldIO(
-        position_field=position_field, eulerian_fields_dict=eulerian_field_dict
+        position_field=position_field,
+        eulerian_fields_dict=eulerian_field_dict,
+        chunks=chunks,
+        compression=compression,
+        compression_opts=compression_opts,
     )
     test_io.save(h5_file_name=h5_file_name, time=time)
     del test_io
 
+    # Check the storage layout of the saved fields
+    with h5py.File(h5_file_name, "r") as f:
+        eulerian_datasets = [f["Eulerian/Scalar/scalar_field"]] + [
+            f[f"Eulerian/Vector/vector_field_{idx_dim}"] for idx_dim in range(grid_dim)
+        ]
+        for dataset in eulerian_datasets:
+            assert dataset.chunks == (None if chunks is None else (1, *chunks))
+            assert dataset.compression == compression
+            if compression_opts is not None:
+                assert dataset.compression_opts == compression_opts
+
     # Load saved HDF5 file for checking
     scalar_field_loaded = np.zeros_like(scalar_field)
     vector_field_loaded = np.zeros_like(vector_field)
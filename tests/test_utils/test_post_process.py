@@ -0,0 +1,27 @@
+import os
+import pytest
+from sopht.utils import make_video_from_image_series
+
+
+@pytest.mark.parametrize("ffmpeg_status", ["missing", "failing"])
+def test_make_video_from_image_series_without_ffmpeg(
+    ffmpeg_status, tmp_path, monkeypatch
+):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    if ffmpeg_status == "failing":
+        ffmpeg = bin_dir / "ffmpeg"
+        ffmpeg.write_text("#!/bin/sh\nexit 1\n")
+        ffmpeg.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.chdir(tmp_path)
+    image_series = [tmp_path / f"snap_{idx:04d}.png" for idx in range(3)]
+    for image in image_series:
+        image.touch()
+
+    # should not raise, and keep the image series around
+    make_video_from_image_series(
+        video_name="flow", image_series_name="snap", frame_rate=10
+    )
+    assert all(os.path.exists(image) for image in image_series)
+    assert not os.path.exists(tmp_path / "flow.mp4")
@@ -0,0 +1,16 @@
+import numpy as np
+import pytest
+from sopht.utils import compute_rod_element_position
+
+
+@pytest.mark.parametrize("dim", [2, 3])
+@pytest.mark.parametrize("n_elems", [8, 16])
+def test_compute_rod_element_position(dim, n_elems):
+    # non contiguous view, as is the case with pyelastica block memory
+    rod_position_collection = np.random.rand(3, 2 * (n_elems + 1))[:, ::2]
+    rod_element_position = np.zeros((dim, n_elems))
+    compute_rod_element_position(rod_element_position, rod_position_collection)
+    correct_rod_element_position = 0.5 * (
+        rod_position_collection[:dim, 1:] + rod_position_collection[:dim, :-1]
+    )
+    np.testing.assert_allclose(rod_element_position, correct_rod_element_position)